@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-from dotenv import load_dotenv
+import os
 
 from livekit import rtc
 from livekit.agents import (
@@ -15,13 +15,17 @@ from livekit.agents.multimodal import MultimodalAgent
 from livekit.plugins import openai
 
 
-load_dotenv(dotenv_path=".env.local")
+if os.path.exists(".env.local"):
+    from dotenv import load_dotenv
+
+    load_dotenv(dotenv_path=".env.local")
+
 logger = logging.getLogger("my-worker")
 logger.setLevel(logging.INFO)
 
 
 async def entrypoint(ctx: JobContext):
-    logger.info(f"connecting to room {ctx.room.name}")
+    logger.info("connecting to room %s", ctx.room.name)
     await ctx.connect(auto_subscribe=AutoSubscribe.AUDIO_ONLY)
 
     participant = await ctx.wait_for_participant()